@@ -1,4 +1,4 @@
-import os, yaml, pathlib, json, uuid
+import os, yaml, pathlib, json, uuid, typing, shutil, errno, http.cookiejar
 from urllib.parse import urljoin
 
 import httpx
@@ -9,10 +9,13 @@ from mcp.server.fastmcp.utilities.logging import get_logger
 
 VERSION = "2026.08.01.002543"
 
+# Use the libyaml C bindings when PyYAML was built with them, they are much faster than the pure Python ones
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # Load OpenAPI spec
 current_dir = pathlib.Path(__file__).parent
 with open(current_dir / 'redmine_openapi.yml') as f:
-    SPEC = yaml.safe_load(f)
+    SPEC = yaml.load(f, Loader=YAML_LOADER)
 
 # Constants from environment
 REDMINE_URL = os.environ['REDMINE_URL'].rstrip('/') + '/'  # Normalize to always end with /
@@ -45,8 +48,14 @@ else:
 
 
 # Core
+
+# Shared client so connections (and TLS sessions) are pooled and reused across tool calls. Its cookie jar rejects
+# everything, so calls stay stateless and are authenticated by the API key only, never by a Redmine session cookie.
+CLIENT = httpx.Client(timeout=60.0, verify=not REDMINE_DANGEROUSLY_ACCEPT_INVALID_CERTS,
+                      cookies=http.cookiejar.CookieJar(policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])))
+
 def request(path: str, method: str = 'get', data: dict = None, params: dict = None,
-            content_type: str = 'application/json', content: bytes = None) -> dict:
+            content_type: str = 'application/json', content: bytes | typing.BinaryIO = None) -> dict:
     headers = {
         'X-Redmine-API-Key': REDMINE_API_KEY,
         'Content-Type': content_type,
@@ -55,8 +64,8 @@ def request(path: str, method: str = 'get', data: dict = None, params: dict = No
     url = urljoin(REDMINE_URL, path.lstrip('/'))
 
     try:
-        response = httpx.request(method=method.lower(), url=url, json=data, params=params, headers=headers,
-                                 content=content, timeout=60.0, verify=not REDMINE_DANGEROUSLY_ACCEPT_INVALID_CERTS)
+        response = CLIENT.request(method=method.lower(), url=url, json=data, params=params, headers=headers,
+                                  content=content)
         response.raise_for_status()
 
         body = None
@@ -68,21 +77,62 @@ def request(path: str, method: str = 'get', data: dict = None, params: dict = No
 
         return {"status_code": response.status_code, "body": body, "error": ""}
     except Exception as e:
-        try:
-            status_code = e.response.status_code
-        except:
-            status_code = 0
+        return error_response(e)
+
+def request_to_file(path: str, file_path: pathlib.Path) -> dict:
+    """Stream the body of a GET request to file_path without holding it in memory."""
+    headers = {
+        'X-Redmine-API-Key': REDMINE_API_KEY,
+        **REDMINE_HEADERS
+    }
+    url = urljoin(REDMINE_URL, path.lstrip('/'))
+
+    # Stream into a temp file next to the target and only move it into place once the download is complete, so
+    # a failed transfer never truncates an existing file or leaves partial data behind. The temp name has a fixed
+    # length so that long target filenames don't push it past the filesystem's name limit. An existing target is
+    # replaced by a new file: its permission bits are kept, but hardlinks to it are not and the new file is owned by
+    # the current user.
+    tmp_path = file_path.parent / f".{uuid.uuid4().hex[:16]}.part"
+    try:
+        # os.replace() only needs a writable directory, so fail on read-only targets like open(path, 'wb') would
+        if file_path.exists() and not os.access(file_path, os.W_OK):
+            raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(file_path))
+
+        with CLIENT.stream(method='get', url=url, headers=headers) as response:
+            if not response.is_success:
+                response.read()  # Make the error body available to error_response()
+            response.raise_for_status()
+
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'xb') as f:
+                for chunk in response.iter_bytes():
+                    f.write(chunk)
 
+        if file_path.exists():
+            shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+
+        return {"status_code": response.status_code, "body": None, "error": ""}
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        return error_response(e)
+
+def error_response(e: Exception) -> dict:
+    try:
+        status_code = e.response.status_code
+    except:
+        status_code = 0
+
+    try:
+        body = e.response.json()
+    except:
         try:
-            body = e.response.json()
+            body = e.response.text
         except:
-            try:
-                body = e.response.text
-            except:
-                body = None
+            body = None
+
+    return {"status_code": status_code, "body": body, "error": f"{e.__class__.__name__}: {e}"}
 
-        return {"status_code": status_code, "body": body, "error": f"{e.__class__.__name__}: {e}"}
-        
 def format_response(obj):
     """Format response as YAML or JSON based on REDMINE_RESPONSE_FORMAT env var."""
     if REDMINE_RESPONSE_FORMAT == 'json':
@@ -90,6 +140,9 @@ def format_response(obj):
     # YAML: Allow direct Unicode output, prevent line wrapping for long lines, and avoid automatic key sorting.
     return yaml.safe_dump(obj, allow_unicode=True, sort_keys=False, width=4096)
 
+# The spec is static, so the formatted path list only needs to be built once
+SPEC_PATHS_LIST = format_response(list(SPEC['paths'].keys()))
+
 
 def wrap_insecure_content(content: str) -> str:
     """Wrap content that may contain user-generated data with security tags to prevent prompt injection."""
@@ -155,7 +208,7 @@ def redmine_paths_list() -> str:
     Returns:
         str: YAML string containing a list of path templates (e.g. '/issues.json')
     """
-    return format_response(list(SPEC['paths'].keys()))
+    return SPEC_PATHS_LIST
 
 @mcp.tool()
 def redmine_paths_info(path_templates: list) -> str:
@@ -167,12 +220,8 @@ def redmine_paths_info(path_templates: list) -> str:
     Returns:
         str: YAML string containing API specifications for the requested paths
     """
-    info = {}
-    for path in path_templates:
-        if path in SPEC['paths']:
-            info[path] = SPEC['paths'][path]
-
-    return format_response(info)
+    paths = SPEC['paths']
+    return format_response({path: paths[path] for path in path_templates if path in paths})
 
 @mcp.tool()
 def redmine_upload(file_path: str, description: str = None) -> str:
@@ -196,11 +245,10 @@ def redmine_upload(file_path: str, description: str = None) -> str:
         if description:
             params['description'] = description
 
+        # Pass the file object so httpx streams it instead of loading the whole file into memory
         with open(path, 'rb') as f:
-            file_content = f.read()
-
-        result = request(path='uploads.json', method='post', params=params,
-                         content_type='application/octet-stream', content=file_content)
+            result = request(path='uploads.json', method='post', params=params,
+                             content_type='application/octet-stream', content=f)
         return format_response(result)
     except Exception as e:
         return format_response({"status_code": 0, "body": None, "error": f"{e.__class__.__name__}: {e}"})
@@ -234,17 +282,10 @@ def redmine_download(attachment_id: int, save_path: str, filename: str | None =
 
             filename = attachment_response["body"]["attachment"]["filename"]
 
-        response = request(f"attachments/download/{attachment_id}/{filename}", "get",
-                           content_type="application/octet-stream")
-        if response["status_code"] != 200 or not response["body"]:
+        response = request_to_file(f"attachments/download/{attachment_id}/{filename}", path)
+        if response["status_code"] != 200:
             return format_response(response)
 
-        # Create parent directories if needed
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(path, 'wb') as f:
-            f.write(response["body"])
-
         return format_response({"status_code": 200, "body": {"saved_to": str(path), "filename": filename}, "error": ""})
     except Exception as e:
         return format_response({"status_code": 0, "body": None, "error": f"{e.__class__.__name__}: {e}"})